@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Local reduction of per-post statistics for the Beehiiv MCP Server.
+Aggregates the email stats of posts fetched with expand=["stats"] without
+another API round-trip. Uses a Numba-JIT kernel over NumPy arrays when
+those packages are installed; otherwise falls back to pure Python.
+"""
+
+from typing import Any, Dict, List
+
+try:
+    import numpy as np
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _sum_columns(recipients, opens, clicks):
+        """Sum the three stat columns in one pass (structure-of-arrays)."""
+        return recipients.sum(), opens.sum(), clicks.sum()
+
+
+# Below this many posts the JIT call overhead outweighs the kernel win.
+_MIN_POSTS_FOR_KERNEL = 32
+
+
+def reduce_email_stats(posts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate email stats across posts expanded with stats.
+
+    Posts without a stats.email block are skipped. Returns totals for
+    recipients, opens and clicks plus the number of posts counted.
+    """
+    recipients: List[int] = []
+    opens: List[int] = []
+    clicks: List[int] = []
+
+    for post in posts:
+        email = (post.get("stats") or {}).get("email")
+        if not email:
+            continue
+        recipients.append(int(email.get("recipients", 0)))
+        opens.append(int(email.get("opens", 0)))
+        clicks.append(int(email.get("clicks", 0)))
+
+    if _HAS_NUMBA and len(recipients) >= _MIN_POSTS_FOR_KERNEL:
+        total_recipients, total_opens, total_clicks = _sum_columns(
+            np.asarray(recipients, dtype=np.int64),
+            np.asarray(opens, dtype=np.int64),
+            np.asarray(clicks, dtype=np.int64),
+        )
+    else:
+        total_recipients = sum(recipients)
+        total_opens = sum(opens)
+        total_clicks = sum(clicks)
+
+    return {
+        "posts_counted": len(recipients),
+        "email": {
+            "recipients": int(total_recipients),
+            "opens": int(total_opens),
+            "clicks": int(total_clicks),
+        },
+    }
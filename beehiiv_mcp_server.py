@@ -5,15 +5,39 @@ Provides read-only access to Beehiiv API for publications, posts, and segments a
 """
 
 import asyncio
-import json
+import functools
 import os
 import signal
 import sys
 import time
 import urllib.parse
+from datetime import datetime
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
-import requests
+import httpx
+
+try:
+    import orjson
+except ImportError:  # optional Rust-backed speedup; stdlib json works too
+    orjson = None
+    import json
+
+try:  # httpx needs the h2 extra for HTTP/2; fall back to HTTP/1.1 without it
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+try:  # only advertise brotli if httpx can actually decompress it
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -27,13 +51,158 @@ from mcp.types import (
 )
 from mcp.server.lowlevel import NotificationOptions
 
+from _reduce import reduce_email_stats
+
 # Initialize the MCP server
 server = Server("beehiiv-analytics")
 
 
+# Pretty-printing inflates payloads by ~30-50% and MCP clients don't render
+# the indentation; emit compact JSON unless explicitly asked to debug.
+_PRETTY = bool(os.getenv("BEEHIIV_MCP_PRETTY"))
+
+if orjson is not None:
+    _DUMP_OPTIONS = orjson.OPT_INDENT_2 if _PRETTY else 0
+
+    def _dump_json(obj: Any) -> str:
+        """Serialize a tool result to JSON text (compact unless BEEHIIV_MCP_PRETTY)."""
+        return orjson.dumps(obj, option=_DUMP_OPTIONS).decode()
+
+else:
+
+    def _dump_json(obj: Any) -> str:
+        """Serialize a tool result to JSON text (compact unless BEEHIIV_MCP_PRETTY)."""
+        if _PRETTY:
+            return json.dumps(obj, indent=2)
+        return json.dumps(obj, separators=(",", ":"))
+
+
+# Response-body parser, chosen once at import instead of per request.
+_load_json = orjson.loads if orjson is not None else json.loads
+
+
+# Payloads with at least this many top-level items are serialized on the
+# default threadpool so a big dump cannot stall the event loop; below it,
+# the thread-hop overhead exceeds the serialization cost.
+_OFFLOAD_MIN_ITEMS = 1000
+
+
+def _item_count(obj: Any) -> int:
+    """Rough size of a tool payload: posts in the envelope, or list length."""
+    if isinstance(obj, dict):
+        data = obj.get("data")
+        return len(data) if isinstance(data, list) else len(obj)
+    if isinstance(obj, list):
+        return len(obj)
+    return 0
+
+
+async def _text_result(obj: Any) -> CallToolResult:
+    """Wrap a payload in a CallToolResult, serializing it exactly once.
+
+    The Beehiiv response is parsed once in _make_request and serialized once
+    here; no handler re-parses or double-serializes the payload. Large
+    payloads (multi-page list_all_posts results) are dumped off-loop so
+    concurrent tool calls are not blocked while they serialize.
+    """
+    if _item_count(obj) >= _OFFLOAD_MIN_ITEMS:
+        text = await asyncio.to_thread(_dump_json, obj)
+    else:
+        text = _dump_json(obj)
+    return CallToolResult(content=[TextContent(type="text", text=text)])
+
+
+class _RetryableAPIError(Exception):
+    """API error worth retrying (429 or 5xx), with optional Retry-After."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _TokenBucket:
+    """Minimal async token bucket for client-side request pacing.
+
+    Refills continuously at `rate` tokens per second up to a burst of
+    `rate` tokens; acquire() sleeps just long enough for the next token
+    when the bucket is empty, smoothing concurrent fan-outs to the API
+    quota instead of tripping 429s and paying the retry round-trips.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@functools.cache
+def _shared_http_client(api_key: str) -> httpx.AsyncClient:
+    """Build (once per API key) the pooled HTTP client shared by every
+    BeehiivAPI instance, so the test scripts and example_usage.py reuse
+    one keep-alive pool instead of each paying TLS setup.
+
+    HTTP/2 (when the h2 extra is installed) multiplexes concurrent
+    requests over a single TLS connection, so even the paginated fan-out
+    reuses one handshake; ALPN negotiation drops to HTTP/1.1 on its own
+    if the API edge ever stops offering h2.
+    """
+    return httpx.AsyncClient(
+        base_url="https://api.beehiiv.com/v2",
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            # Large list_posts + stats payloads compress well; httpx
+            # decompresses transparently.
+            "Accept-Encoding": _ACCEPT_ENCODING,
+        },
+        http2=_HTTP2,
+        # Fail fast on unreachable hosts; allow slow large responses
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=64),
+    )
+
+
 class BeehiivAPI:
     """Beehiiv API client for analytics operations."""
 
+    # Valid values for the fixed list_posts query keys; checked client-side
+    # so a bad filter fails fast instead of costing a rejected round-trip.
+    _VALID_STATUS = frozenset({"draft", "confirmed", "archived", "all"})
+    _VALID_AUDIENCE = frozenset({"free", "premium", "all"})
+    _VALID_PLATFORM = frozenset({"web", "email", "both", "all"})
+    _VALID_ORDER_BY = frozenset({"created", "publish_date", "displayed_date"})
+    _VALID_DIRECTION = frozenset({"asc", "desc"})
+
+    # order_by values that are date fields, eligible for the client-side sort
+    _DATE_ORDER_FIELDS = frozenset({"publish_date", "displayed_date", "created"})
+
+    # Upper bound on cached responses so a long-running server over many
+    # publications cannot grow the cache without limit.
+    _CACHE_MAX_ENTRIES = 256
+
+    # TTL (seconds) per endpoint suffix, matched in order. Publications and
+    # segments change on the order of minutes-hours; post lists much faster.
+    _CACHE_POLICY = (
+        ("/posts/aggregate_stats", 30),
+        ("/segments", 60),
+        ("/posts", 10),
+        ("/publications", 300),
+    )
+
     def __init__(self, api_key: str):
         """Initialize with API key."""
         self.api_key = api_key
@@ -42,70 +211,284 @@ class BeehiivAPI:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
+        # Whether this instance ever touched the shared HTTP client, so
+        # aclose() on an unused instance does not create one just to close it.
+        self._client_opened = False
+        # TTL cache for GET responses: key -> (monotonic timestamp, payload)
+        self._cache: Dict[tuple, tuple] = {}
+        # Earliest monotonic time the next request may be issued; pushed
+        # forward when Beehiiv's rate-limit headers say we are nearly out.
+        self._next_ok_at: float = 0.0
+        # Proactive pacing: requests/second, overridable for other quotas.
+        self._limiter = _TokenBucket(float(os.getenv("BEEHIIV_RATE_LIMIT", "10")))
+        # Pending get_post_details futures awaiting a batched flush:
+        # (publication_id, expand) -> {post_id: Future}
+        self._detail_batches: Dict[tuple, Dict[str, asyncio.Future]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared httpx client, rebuilding it if it was closed."""
+        client = _shared_http_client(self.api_key)
+        if client.is_closed:
+            # A previous instance closed the shared pool (e.g. a finished
+            # script); drop the cached entry and build a fresh one.
+            _shared_http_client.cache_clear()
+            client = _shared_http_client(self.api_key)
+        self._client_opened = True
+        return client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if this instance opened it."""
+        if self._client_opened:
+            client = _shared_http_client(self.api_key)
+            if not client.is_closed:
+                await client.aclose()
+
+    async def __aenter__(self) -> "BeehiivAPI":
+        """Open the HTTP client eagerly on the current event loop."""
+        self._get_client()
+        return self
+
+    async def prewarm(self) -> None:
+        """Prime DNS resolution and the TLS connection to the API host.
+
+        Issues a cheap HEAD so the first real tool call finds a hot
+        connection pool instead of paying 200-500 ms of setup. Failures
+        are ignored; the first real request will surface any problem.
+        """
+        try:
+            await self._get_client().head("/publications")
+        except Exception:
+            pass
 
-    def _make_request(
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    @staticmethod
+    def _parse_retry_after(headers) -> Optional[float]:
+        """Parse a Retry-After header value (seconds), if present and sane."""
+        try:
+            value = float(headers.get("Retry-After")) if headers else None
+        except (TypeError, ValueError):
+            return None
+        if value is not None and 0 < value <= 60:
+            return value
+        return None
+
+    # Hold off new requests once the remaining quota drops below this.
+    _RATE_LIMIT_THRESHOLD = 2
+
+    def _note_rate_limit(self, headers) -> None:
+        """Update the request gate from Beehiiv's rate-limit headers.
+
+        When X-RateLimit-Remaining falls below the threshold, defer the next
+        request until X-RateLimit-Reset so we never trigger a 429 storm.
+        """
+        if not headers:
+            return
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining", ""))
+            reset = float(headers.get("X-RateLimit-Reset", ""))
+        except (TypeError, ValueError):
+            return
+        if remaining >= self._RATE_LIMIT_THRESHOLD:
+            return
+        # Reset may be an absolute epoch or a delta in seconds
+        if reset > 1e6:
+            reset = max(0.0, reset - time.time())
+        self._next_ok_at = time.monotonic() + min(reset, 60.0)
+
+    @classmethod
+    def _cache_ttl(cls, endpoint: str) -> Optional[int]:
+        """Return the cache TTL for an endpoint, or None if uncacheable."""
+        for suffix, ttl in cls._CACHE_POLICY:
+            if endpoint.endswith(suffix):
+                return ttl
+            # "{suffix}/{id}" detail paths share the list's TTL, but only
+            # one segment deep: /publications/{id} is cached, while e.g.
+            # /publications/{id}/subscriptions/by_email/... falls through
+            # so the unsubscribe flow never reads stale status.
+            marker = f"{suffix}/"
+            start = endpoint.find(marker)
+            if start != -1 and "/" not in endpoint[start + len(marker):]:
+                return ttl
+        return None
+
+    @staticmethod
+    def _cache_key(method: str, endpoint: str, params: Optional[Dict]) -> tuple:
+        """Build a hashable cache key from the request shape."""
+        items = []
+        for key, value in sorted((params or {}).items()):
+            if isinstance(value, list):
+                value = tuple(value)
+            items.append((key, value))
+        return (method, endpoint, tuple(items))
+
+    async def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
         json_body: Optional[Dict] = None,
         allow_404: bool = False,
-    ) -> Optional[Dict[str, Any]]:
+        data_key: Optional[str] = "data",
+        default: Any = None,
+    ) -> Optional[Any]:
         """Make a request to the Beehiiv API with improved error handling.
 
         Pass json_body to send a JSON request body (for write endpoints).
         Set allow_404=True to return None on a 404 instead of raising (useful
         for lookups where "not found" is an expected, non-fatal outcome).
+
+        Beehiiv wraps every payload in a {"data": ...} envelope; by default
+        the inner object is returned directly (default when missing). Pass
+        data_key=None to get the full envelope, e.g. for pagination metadata.
+
+        Cacheable GETs (see _CACHE_POLICY) are served from the in-process TTL
+        cache when fresh; if the API errors, the last stale entry is returned
+        as a fallback rather than failing the tool call.
+        """
+
+        def unwrap(payload: Optional[Dict[str, Any]]) -> Optional[Any]:
+            if payload is None or data_key is None:
+                return payload
+            return payload.get(data_key, default)
+
+        ttl = self._cache_ttl(endpoint) if method == "GET" and not json_body else None
+        key = self._cache_key(method, endpoint, params) if ttl is not None else None
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return unwrap(cached[1])
+
+        try:
+            data = await self._fetch_with_retry(
+                method, endpoint, params, json_body, allow_404
+            )
+        except Exception:
+            # Fall back to a stale entry instead of surfacing a transient
+            # API error for data we have already seen.
+            if key is not None and key in self._cache:
+                return unwrap(self._cache[key][1])
+            raise
+
+        if key is not None and data is not None:
+            if len(self._cache) >= self._CACHE_MAX_ENTRIES:
+                self._evict_cache()
+            self._cache[key] = (time.monotonic(), data)
+        return unwrap(data)
+
+    def _evict_cache(self) -> None:
+        """Drop expired entries; if still full, drop the oldest one."""
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (stamp, _) in self._cache.items()
+            if now - stamp >= max(ttl for _, ttl in self._CACHE_POLICY)
+        ]
+        for key in expired:
+            del self._cache[key]
+        if len(self._cache) >= self._CACHE_MAX_ENTRIES:
+            oldest = min(self._cache, key=lambda k: self._cache[k][0])
+            del self._cache[oldest]
+
+    async def clear_cache(self) -> Dict[str, Any]:
+        """Drop all cached responses so the next calls hit the API fresh."""
+        dropped = len(self._cache)
+        self._cache.clear()
+        return {"cleared": True, "entries_dropped": dropped}
+
+    async def _fetch_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json_body: Optional[Dict] = None,
+        allow_404: bool = False,
+        max_attempts: int = 3,
+    ) -> Optional[Dict[str, Any]]:
+        """Retry transient API failures (429/5xx) with exponential backoff.
+
+        Honors the Retry-After header when Beehiiv provides one; otherwise
+        backs off 0.5 * 2**attempt seconds between attempts.
         """
-        url = f"{self.base_url}{endpoint}"
+        for attempt in range(max_attempts):
+            try:
+                return await self._fetch(method, endpoint, params, json_body, allow_404)
+            except _RetryableAPIError as e:
+                if attempt == max_attempts - 1:
+                    raise Exception(str(e))
+                delay = e.retry_after or 0.5 * 2**attempt
+                await asyncio.sleep(delay)
+
+    async def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json_body: Optional[Dict] = None,
+        allow_404: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Perform the actual HTTP round-trip for _make_request."""
+        client = self._get_client()
+
+        # Pace proactively via the token bucket, then respect the reactive
+        # gate set from previous rate-limit response headers.
+        await self._limiter.acquire()
+        delay = self._next_ok_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
         try:
-            response = requests.request(
-                method,
-                url,
-                headers=self.headers,
-                params=params,
-                json=json_body,
-                timeout=30,
+            response = await client.request(
+                method, endpoint, params=params, json=json_body
             )
+            self._note_rate_limit(response.headers)
+            if response.status_code == 404 and allow_404:
+                return None
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.Timeout:
+            return _load_json(response.content)
+        except httpx.TimeoutException:
             raise Exception("API request timed out. Please try again.")
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise Exception(
                 "Unable to connect to Beehiiv API. Please check your internet connection."
             )
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 401:
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if status == 401:
                 raise Exception("Invalid API key. Please check your BEEHIIV_API_KEY.")
-            elif response.status_code == 403:
+            elif status == 403:
                 raise Exception(
                     "API access forbidden. Please check your API key permissions."
                 )
-            elif response.status_code == 404:
-                if allow_404:
-                    return None
+            elif status == 404:
                 raise Exception("Resource not found.")
-            elif response.status_code >= 500:
-                raise Exception("Beehiiv API server error. Please try again later.")
-            else:
-                raise Exception(
-                    f"API request failed with status {response.status_code}: {str(e)}"
+            elif status == 429:
+                raise _RetryableAPIError(
+                    "Beehiiv API rate limit exceeded. Please try again later.",
+                    retry_after=self._parse_retry_after(e.response.headers),
                 )
-        except requests.exceptions.RequestException as e:
+            elif status >= 500:
+                raise _RetryableAPIError(
+                    "Beehiiv API server error. Please try again later.",
+                    retry_after=self._parse_retry_after(e.response.headers),
+                )
+            else:
+                raise Exception(f"API request failed with status {status}: {str(e)}")
+        except httpx.HTTPError as e:
             raise Exception(f"API request failed: {str(e)}")
 
-    def get_publications(self) -> List[Dict[str, Any]]:
+    async def get_publications(self) -> List[Dict[str, Any]]:
         """Get list of all publications."""
-        data = self._make_request("GET", "/publications")
-        return data.get("data", [])
+        return await self._make_request("GET", "/publications", default=[])
 
-    def get_publication_details(self, publication_id: str) -> Dict[str, Any]:
+    async def get_publication_details(self, publication_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific publication."""
-        data = self._make_request("GET", f"/publications/{publication_id}")
-        return data.get("data", {})
+        return await self._make_request(
+            "GET", f"/publications/{publication_id}", default={}
+        )
 
-    def list_posts(
+    async def list_posts(
         self,
         publication_id: str,
         limit: int = 10,
@@ -118,6 +501,18 @@ class BeehiivAPI:
         expand: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """List posts from a publication with various filters."""
+        for value, valid, label in (
+            (status, self._VALID_STATUS, "status"),
+            (audience, self._VALID_AUDIENCE, "audience"),
+            (platform, self._VALID_PLATFORM, "platform"),
+            (order_by, self._VALID_ORDER_BY, "order_by"),
+            (direction, self._VALID_DIRECTION, "direction"),
+        ):
+            if value not in valid:
+                raise Exception(
+                    f"Invalid {label} '{value}'; expected one of {sorted(valid)}."
+                )
+
         params = {
             "limit": min(limit, 100),  # API max is 100
             "page": page,
@@ -132,60 +527,223 @@ class BeehiivAPI:
         if expand:
             params["expand"] = expand
 
-        data = self._make_request(
-            "GET", f"/publications/{publication_id}/posts", params
+        data = await self._make_request(
+            "GET", f"/publications/{publication_id}/posts", params, data_key=None
         )
 
-        # Client-side sorting as fallback to ensure proper date ordering
+        # Client-side sorting as fallback to ensure proper date ordering.
+        # Beehiiv's sort only misbehaves when posts lack the date field
+        # (drafts, unpublished), so when every post has it the server
+        # ordering is trusted and the O(n log n) re-sort is skipped.
         posts = data.get("data", [])
-        if posts and order_by in ["publish_date", "displayed_date", "created"]:
-            # Sort posts to ensure proper ordering (newest first for desc, oldest first for asc)
-            reverse_order = direction == "desc"
-
-            # Use the appropriate date field
-            date_field = order_by
-
-            # Separate posts with and without dates
-            posts_with_dates = [
-                post for post in posts if post.get(date_field) is not None
-            ]
-            posts_without_dates = [
-                post for post in posts if post.get(date_field) is None
-            ]
-
-            # Sort posts with dates
-            if posts_with_dates:
-                posts_with_dates.sort(
-                    key=lambda x: x.get(date_field, 0), reverse=reverse_order
-                )
+        if (
+            posts
+            and order_by in self._DATE_ORDER_FIELDS
+            and any(post.get(order_by) is None for post in posts)
+        ):
+            # _make_request may hand back the cached envelope itself, so
+            # build a fresh dict instead of assigning into it; otherwise
+            # the re-sorted list would leak into later cache hits.
+            data = {**data, "data": self._sort_posts_by_date(posts, order_by, direction)}
 
-            # Combine: posts with dates (sorted) first, then posts without dates
-            if reverse_order:
-                # For desc: newest first, so posts with dates come first
-                sorted_posts = posts_with_dates + posts_without_dates
-            else:
-                # For asc: oldest first, so posts without dates come first
-                sorted_posts = posts_without_dates + posts_with_dates
+        return data
 
-            # Update the data with sorted posts
-            data["data"] = sorted_posts
+    @staticmethod
+    def _sort_posts_by_date(
+        posts: List[Dict[str, Any]], date_field: str, direction: str
+    ) -> List[Dict[str, Any]]:
+        """Sort posts by a date field (newest first for desc, oldest first for asc)."""
+        reverse_order = direction == "desc"
+
+        # Decorate-sort-undecorate: parse each date once up front so the
+        # O(n log n) comparisons run on cheap pre-built tuples instead of
+        # re-fetching and re-hashing the ISO strings per comparison. The
+        # (has_date, parsed) key keeps undated posts first for asc and
+        # (after reversal) last for desc, as before. Epoch integers are
+        # passed through unparsed; they compare correctly as-is.
+        def parse(value: Any) -> Any:
+            if isinstance(value, str):
+                try:
+                    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+                except ValueError:
+                    return None
+            return value
+
+        values = [post.get(date_field) for post in posts]
+        keys = [parse(value) if value is not None else None for value in values]
+        # A single malformed string would leave the keys mixing datetime
+        # and str, which sort() rejects; in that case compare the raw
+        # strings for every post (lexicographic order is still correct
+        # for ISO text), matching the pre-parse behavior.
+        if any(key is None and value is not None for key, value in zip(keys, values)):
+            keys = values
+
+        decorated = [
+            ((value is not None, key if value is not None else 0), post)
+            for post, value, key in zip(posts, values, keys)
+        ]
+        decorated.sort(key=itemgetter(0), reverse=reverse_order)
+        return [post for _, post in decorated]
 
-        return data
+    # Hard ceiling on posts fetched in one list_posts_all call, to prevent
+    # runaway fan-out against huge archives.
+    _MAX_TOTAL_POSTS = 5000
+
+    async def list_posts_all(
+        self,
+        publication_id: str,
+        max_pages: int = 10,
+        status: str = "all",
+        audience: str = "all",
+        platform: str = "all",
+        order_by: str = "publish_date",
+        direction: str = "desc",
+        expand: Optional[List[str]] = None,
+        total_limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """List posts across multiple pages, fetching pages concurrently.
 
-    def get_post_details(
+        Fetches page 1 to learn the total page count, then pulls the
+        remaining pages (up to max_pages) in parallel under a semaphore so
+        an N-page fetch costs ~1 round-trip instead of N. Pass total_limit
+        to request a number of posts instead of pages; the result is
+        trimmed to exactly that many (capped at 5000).
+        """
+        if total_limit is not None:
+            total_limit = min(total_limit, self._MAX_TOTAL_POSTS)
+            max_pages = -(-total_limit // 100)  # ceil division, 100 per page
+        kwargs = dict(
+            publication_id=publication_id,
+            limit=100,
+            status=status,
+            audience=audience,
+            platform=platform,
+            order_by=order_by,
+            direction=direction,
+            expand=expand,
+        )
+        first = await self.list_posts(page=1, **kwargs)
+        total_pages = min(first.get("total_pages", 1), max_pages)
+        # list_posts may return the TTL-cached envelope, so never mutate
+        # first or its data list; the combined result goes in fresh objects.
+        combined = list(first.get("data", []))
+
+        if total_pages > 1:
+            semaphore = asyncio.Semaphore(8)
+
+            async def fetch_page(page: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.list_posts(page=page, **kwargs)
+
+            pages = await asyncio.gather(
+                *(fetch_page(p) for p in range(2, total_pages + 1))
+            )
+            for page_data in pages:
+                combined.extend(page_data.get("data", []))
+            if combined and order_by in self._DATE_ORDER_FIELDS:
+                combined = self._sort_posts_by_date(combined, order_by, direction)
+
+        if total_limit is not None and len(combined) > total_limit:
+            combined = combined[:total_limit]
+
+        result = {**first, "data": combined}
+        if total_pages > 1:
+            result["total_pages_fetched"] = total_pages
+        return result
+
+    async def get_posts_local_aggregate(
+        self,
+        publication_id: str,
+        status: str = "confirmed",
+        max_pages: int = 10,
+    ) -> Dict[str, Any]:
+        """Aggregate email stats locally from posts expanded with stats.
+
+        Unlike get_posts_aggregate_stats, this fetches the raw posts and
+        reduces them in-process (see _reduce), which allows summarizing
+        subsets Beehiiv's aggregate endpoint cannot filter to.
+        """
+        result = await self.list_posts_all(
+            publication_id, max_pages=max_pages, status=status, expand=["stats"]
+        )
+        return reduce_email_stats(result.get("data", []))
+
+    # How long get_post_details waits to collect callers into one batch.
+    _BATCH_WINDOW = 0.01
+
+    async def get_post_details(
+        self, publication_id: str, post_id: str, expand: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get detailed information about a specific post.
+
+        Concurrent calls for the same publication are coalesced for ~10 ms
+        and served from a single batched list fetch where possible, so a
+        burst of N lookups costs one round-trip instead of N.
+        """
+        loop = asyncio.get_running_loop()
+        batch_key = (publication_id, tuple(expand) if expand else None)
+        batch = self._detail_batches.get(batch_key)
+        if batch is None:
+            batch = self._detail_batches[batch_key] = {}
+            loop.call_later(
+                self._BATCH_WINDOW,
+                lambda: asyncio.ensure_future(self._flush_post_details(batch_key)),
+            )
+        future = batch.get(post_id)
+        if future is None:
+            future = batch[post_id] = loop.create_future()
+        return await future
+
+    async def _flush_post_details(self, batch_key: tuple) -> None:
+        """Resolve a batch of pending get_post_details lookups.
+
+        A single pending lookup falls through to the point endpoint. With
+        two or more, one list_posts page is fetched and pending ids are
+        resolved from it; ids not on that page fall back individually.
+        """
+        batch = self._detail_batches.pop(batch_key, None)
+        if not batch:
+            return
+        publication_id, expand_key = batch_key
+        expand = list(expand_key) if expand_key else None
+
+        found: Dict[str, Dict[str, Any]] = {}
+        if len(batch) > 1:
+            try:
+                page = await self.list_posts(
+                    publication_id, limit=100, expand=expand
+                )
+                found = {p.get("id"): p for p in page.get("data", [])}
+            except Exception:
+                found = {}
+
+        for post_id, future in batch.items():
+            if future.done():
+                continue
+            post = found.get(post_id)
+            if post is not None:
+                future.set_result(post)
+                continue
+            try:
+                future.set_result(
+                    await self._fetch_post_details(publication_id, post_id, expand)
+                )
+            except Exception as e:
+                future.set_exception(e)
+
+    async def _fetch_post_details(
         self, publication_id: str, post_id: str, expand: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        """Get detailed information about a specific post."""
+        """Fetch a single post from the point endpoint (unbatched)."""
         params = {}
         if expand:
             params["expand"] = expand
 
-        data = self._make_request(
-            "GET", f"/publications/{publication_id}/posts/{post_id}", params
+        return await self._make_request(
+            "GET", f"/publications/{publication_id}/posts/{post_id}", params, default={}
         )
-        return data.get("data", {})
 
-    def get_posts_aggregate_stats(
+    async def get_posts_aggregate_stats(
         self,
         publication_id: str,
         status: str = "confirmed",
@@ -199,26 +757,28 @@ class BeehiivAPI:
             "platform": platform,
         }
 
-        data = self._make_request(
-            "GET", f"/publications/{publication_id}/posts/aggregate_stats", params
+        return await self._make_request(
+            "GET",
+            f"/publications/{publication_id}/posts/aggregate_stats",
+            params,
+            default={},
         )
-        return data.get("data", {})
 
-    def list_segments(self, publication_id: str) -> List[Dict[str, Any]]:
+    async def list_segments(self, publication_id: str) -> List[Dict[str, Any]]:
         """Get list of segments for a publication."""
-        data = self._make_request("GET", f"/publications/{publication_id}/segments")
-        return data.get("data", [])
+        return await self._make_request(
+            "GET", f"/publications/{publication_id}/segments", default=[]
+        )
 
-    def get_segment_details(
+    async def get_segment_details(
         self, publication_id: str, segment_id: str
     ) -> Dict[str, Any]:
         """Get detailed information about a specific segment."""
-        data = self._make_request(
-            "GET", f"/publications/{publication_id}/segments/{segment_id}"
+        return await self._make_request(
+            "GET", f"/publications/{publication_id}/segments/{segment_id}", default={}
         )
-        return data.get("data", {})
 
-    def get_subscription_by_email(
+    async def get_subscription_by_email(
         self, publication_id: str, email: str
     ) -> Optional[Dict[str, Any]]:
         """Look up a single subscription by email.
@@ -228,16 +788,13 @@ class BeehiivAPI:
         The email is URL-encoded as required by the Beehiiv API.
         """
         encoded = urllib.parse.quote(email, safe="")
-        data = self._make_request(
+        return await self._make_request(
             "GET",
             f"/publications/{publication_id}/subscriptions/by_email/{encoded}",
             allow_404=True,
         )
-        if not data:
-            return None
-        return data.get("data")
 
-    def unsubscribe_subscription(
+    async def unsubscribe_subscription(
         self, publication_id: str, subscription_id: str
     ) -> Dict[str, Any]:
         """Mark a single subscription as inactive (unsubscribe).
@@ -245,14 +802,14 @@ class BeehiivAPI:
         This uses the reversible unsubscribe action; it does NOT delete the
         subscriber record.
         """
-        data = self._make_request(
+        return await self._make_request(
             "PUT",
             f"/publications/{publication_id}/subscriptions/{subscription_id}",
             json_body={"unsubscribe": True},
+            default={},
         )
-        return data.get("data", {}) if data else {}
 
-    def unsubscribe_emails(
+    async def unsubscribe_emails(
         self, publication_id: str, emails: List[str], apply: bool = False
     ) -> Dict[str, Any]:
         """Unsubscribe (mark inactive) a list of subscribers by email.
@@ -267,7 +824,7 @@ class BeehiivAPI:
 
         for email in emails:
             try:
-                sub = self.get_subscription_by_email(publication_id, email)
+                sub = await self.get_subscription_by_email(publication_id, email)
             except Exception as e:
                 results.append(
                     {"email": email, "action": "failed", "detail": f"lookup error: {e}"}
@@ -314,7 +871,7 @@ class BeehiivAPI:
                 continue
 
             try:
-                updated = self.unsubscribe_subscription(publication_id, sub_id)
+                updated = await self.unsubscribe_subscription(publication_id, sub_id)
             except Exception as e:
                 results.append(
                     {
@@ -336,7 +893,7 @@ class BeehiivAPI:
                 }
             )
             changed += 1
-            time.sleep(0.5)  # be gentle with rate limits between writes
+            await asyncio.sleep(0.5)  # be gentle with rate limits between writes
 
         change_key = "unsubscribed" if apply else "would_unsubscribe"
         return {
@@ -362,354 +919,521 @@ def get_api_client() -> BeehiivAPI:
     return api_client
 
 
+# Input schemas for the tool catalogue, frozen once at import time. The
+# Tool constructor copies them into plain dicts, so freezing the source
+# constants guards against accidental mutation without per-call cost.
+_LIST_PUBLICATIONS_SCHEMA = MappingProxyType({"type": "object", "properties": {}, "required": []})
+
+_GET_PUBLICATION_DETAILS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "publication_id": {
+            "type": "string",
+            "description": "The publication ID (e.g., pub_00000000-0000-0000-0000-000000000000)",
+        }
+    },
+    "required": ["publication_id"],
+})
+
+_LIST_POSTS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "publication_id": {
+            "type": "string",
+            "description": "The publication ID",
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Number of posts to return (1-100, default: 10)",
+            "minimum": 1,
+            "maximum": 100,
+            "default": 10,
+        },
+        "page": {
+            "type": "integer",
+            "description": "Page number for pagination (default: 1)",
+            "minimum": 1,
+            "default": 1,
+        },
+        "status": {
+            "type": "string",
+            "description": "Filter by post status",
+            "enum": ["draft", "confirmed", "archived", "all"],
+            "default": "all",
+        },
+        "audience": {
+            "type": "string",
+            "description": "Filter by audience type",
+            "enum": ["free", "premium", "all"],
+            "default": "all",
+        },
+        "platform": {
+            "type": "string",
+            "description": "Filter by platform",
+            "enum": ["web", "email", "both", "all"],
+            "default": "all",
+        },
+        "order_by": {
+            "type": "string",
+            "description": "Field to sort by. Use 'publish_date' or 'displayed_date' for most recent posts, 'created' for creation date",
+            "enum": ["created", "publish_date", "displayed_date"],
+            "default": "publish_date",
+        },
+        "direction": {
+            "type": "string",
+            "description": "Sort direction",
+            "enum": ["asc", "desc"],
+            "default": "desc",
+        },
+        "expand": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": [
+                    "stats",
+                    "free_web_content",
+                    "free_email_content",
+                    "free_rss_content",
+                    "premium_web_content",
+                    "premium_email_content",
+                ],
+            },
+            "description": "Additional data to include in response",
+        },
+    },
+    "required": ["publication_id"],
+})
+
+_LIST_ALL_POSTS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "publication_id": {
+            "type": "string",
+            "description": "The publication ID",
+        },
+        "total_limit": {
+            "type": "integer",
+            "description": "Maximum number of posts to return across all pages (default: 500, capped at 5000)",
+            "minimum": 1,
+            "maximum": 5000,
+            "default": 500,
+        },
+        "status": {
+            "type": "string",
+            "description": "Filter by post status",
+            "enum": ["draft", "confirmed", "archived", "all"],
+            "default": "all",
+        },
+        "audience": {
+            "type": "string",
+            "description": "Filter by audience type",
+            "enum": ["free", "premium", "all"],
+            "default": "all",
+        },
+        "platform": {
+            "type": "string",
+            "description": "Filter by platform",
+            "enum": ["web", "email", "both", "all"],
+            "default": "all",
+        },
+        "order_by": {
+            "type": "string",
+            "description": "Field to sort by. Use 'publish_date' or 'displayed_date' for most recent posts, 'created' for creation date",
+            "enum": ["created", "publish_date", "displayed_date"],
+            "default": "publish_date",
+        },
+        "direction": {
+            "type": "string",
+            "description": "Sort direction",
+            "enum": ["asc", "desc"],
+            "default": "desc",
+        },
+        "expand": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": [
+                    "stats",
+                    "free_web_content",
+                    "free_email_content",
+                    "free_rss_content",
+                    "premium_web_content",
+                    "premium_email_content",
+                ],
+            },
+            "description": "Additional data to include in response",
+        },
+    },
+    "required": ["publication_id"],
+})
+
+_GET_POST_DETAILS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "publication_id": {
+            "type": "string",
+            "description": "The publication ID",
+        },
+        "post_id": {
+            "type": "string",
+            "description": "The post ID (e.g., post_00000000-0000-0000-0000-000000000000)",
+        },
+        "expand": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": [
+                    "stats",
+                    "free_web_content",
+                    "free_email_content",
+                    "free_rss_content",
+                    "premium_web_content",
+                    "premium_email_content",
+                ],
+            },
+            "description": "Additional data to include in response",
+        },
+    },
+    "required": ["publication_id", "post_id"],
+})
+
+_GET_POSTS_SUMMARY_STATS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "publication_id": {
+            "type": "string",
+            "description": "The publication ID",
+        },
+        "status": {
+            "type": "string",
+            "description": "Filter by post status for stats",
+            "enum": ["draft", "confirmed", "archived", "all"],
+            "default": "confirmed",
+        },
+        "audience": {
+            "type": "string",
+            "description": "Filter by audience type for stats",
+            "enum": ["free", "premium", "all"],
+            "default": "all",
+        },
+        "platform": {
+            "type": "string",
+            "description": "Filter by platform for stats",
+            "enum": ["web", "email", "both", "all"],
+            "default": "all",
+        },
+    },
+    "required": ["publication_id"],
+})
+
+_GET_POSTS_LOCAL_STATS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "publication_id": {
+            "type": "string",
+            "description": "The publication ID",
+        },
+        "status": {
+            "type": "string",
+            "description": "Filter by post status before aggregating",
+            "enum": ["draft", "confirmed", "archived", "all"],
+            "default": "confirmed",
+        },
+        "max_pages": {
+            "type": "integer",
+            "description": "Maximum number of 100-post pages to fetch (default: 10)",
+            "minimum": 1,
+            "maximum": 50,
+            "default": 10,
+        },
+    },
+    "required": ["publication_id"],
+})
+
+_LIST_SEGMENTS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "publication_id": {
+            "type": "string",
+            "description": "The publication ID",
+        }
+    },
+    "required": ["publication_id"],
+})
+
+_GET_SEGMENT_DETAILS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "publication_id": {
+            "type": "string",
+            "description": "The publication ID",
+        },
+        "segment_id": {
+            "type": "string",
+            "description": "The segment ID",
+        },
+    },
+    "required": ["publication_id", "segment_id"],
+})
+
+_CLEAR_CACHE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {},
+})
+
+_UNSUBSCRIBE_SUBSCRIBERS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "publication_id": {
+            "type": "string",
+            "description": "The publication ID (e.g., pub_00000000-0000-0000-0000-000000000000)",
+        },
+        "emails": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Email addresses to unsubscribe",
+        },
+        "apply": {
+            "type": "boolean",
+            "description": "When false (default), performs a dry run and reports what would change without modifying anything. Set true to actually unsubscribe.",
+            "default": False,
+        },
+    },
+    "required": ["publication_id", "emails"],
+})
+
+# The tool catalogue is static; build it once at import time instead of
+# reconstructing every Tool object and its nested schemas per request.
+_TOOLS_RESULT = ListToolsResult(
+    tools=[
+        Tool(
+            name="list_publications",
+            description="List all publications accessible with the API key",
+            inputSchema=_LIST_PUBLICATIONS_SCHEMA,
+        ),
+        Tool(
+            name="get_publication_details",
+            description="Get detailed information about a specific publication",
+            inputSchema=_GET_PUBLICATION_DETAILS_SCHEMA,
+        ),
+        Tool(
+            name="list_posts",
+            description="List posts from a publication with various filters",
+            inputSchema=_LIST_POSTS_SCHEMA,
+        ),
+        Tool(
+            name="list_all_posts",
+            description="List posts across all pages of a publication, fetching pages concurrently",
+            inputSchema=_LIST_ALL_POSTS_SCHEMA,
+        ),
+        Tool(
+            name="get_post_details",
+            description="Get detailed information about a specific post",
+            inputSchema=_GET_POST_DETAILS_SCHEMA,
+        ),
+        Tool(
+            name="get_posts_summary_stats",
+            description="Get aggregate statistics for all posts in a publication",
+            inputSchema=_GET_POSTS_SUMMARY_STATS_SCHEMA,
+        ),
+        Tool(
+            name="get_posts_local_stats",
+            description=(
+                "Aggregate email statistics (recipients, opens, clicks) locally "
+                "from per-post stats, supporting status subsets the aggregate "
+                "stats endpoint cannot filter to"
+            ),
+            inputSchema=_GET_POSTS_LOCAL_STATS_SCHEMA,
+        ),
+        Tool(
+            name="list_segments",
+            description="List all segments for a publication",
+            inputSchema=_LIST_SEGMENTS_SCHEMA,
+        ),
+        Tool(
+            name="get_segment_details",
+            description="Get detailed information about a specific segment",
+            inputSchema=_GET_SEGMENT_DETAILS_SCHEMA,
+        ),
+        Tool(
+            name="clear_cache",
+            description="Clear the in-process response cache so the next calls fetch fresh data from the API",
+            inputSchema=_CLEAR_CACHE_SCHEMA,
+        ),
+        Tool(
+            name="unsubscribe_subscribers",
+            description=(
+                "Unsubscribe one or more subscribers (mark them INACTIVE) by "
+                "email. They stop receiving sends but their records are kept, "
+                "so this is reversible; it does NOT delete anyone. Defaults to a "
+                "dry run that reports what would change: set apply=true to "
+                "actually make the changes. Emails that are already inactive or "
+                "not found are skipped, so it is safe to re-run."
+            ),
+            inputSchema=_UNSUBSCRIBE_SUBSCRIBERS_SCHEMA,
+        ),
+    ]
+)
+
+
 @server.list_tools()
 async def list_tools() -> ListToolsResult:
     """List available tools."""
-    return ListToolsResult(
-        tools=[
-            Tool(
-                name="list_publications",
-                description="List all publications accessible with the API key",
-                inputSchema={"type": "object", "properties": {}, "required": []},
-            ),
-            Tool(
-                name="get_publication_details",
-                description="Get detailed information about a specific publication",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "publication_id": {
-                            "type": "string",
-                            "description": "The publication ID (e.g., pub_00000000-0000-0000-0000-000000000000)",
-                        }
-                    },
-                    "required": ["publication_id"],
-                },
-            ),
-            Tool(
-                name="list_posts",
-                description="List posts from a publication with various filters",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "publication_id": {
-                            "type": "string",
-                            "description": "The publication ID",
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Number of posts to return (1-100, default: 10)",
-                            "minimum": 1,
-                            "maximum": 100,
-                            "default": 10,
-                        },
-                        "page": {
-                            "type": "integer",
-                            "description": "Page number for pagination (default: 1)",
-                            "minimum": 1,
-                            "default": 1,
-                        },
-                        "status": {
-                            "type": "string",
-                            "description": "Filter by post status",
-                            "enum": ["draft", "confirmed", "archived", "all"],
-                            "default": "all",
-                        },
-                        "audience": {
-                            "type": "string",
-                            "description": "Filter by audience type",
-                            "enum": ["free", "premium", "all"],
-                            "default": "all",
-                        },
-                        "platform": {
-                            "type": "string",
-                            "description": "Filter by platform",
-                            "enum": ["web", "email", "both", "all"],
-                            "default": "all",
-                        },
-                        "order_by": {
-                            "type": "string",
-                            "description": "Field to sort by. Use 'publish_date' or 'displayed_date' for most recent posts, 'created' for creation date",
-                            "enum": ["created", "publish_date", "displayed_date"],
-                            "default": "publish_date",
-                        },
-                        "direction": {
-                            "type": "string",
-                            "description": "Sort direction",
-                            "enum": ["asc", "desc"],
-                            "default": "desc",
-                        },
-                        "expand": {
-                            "type": "array",
-                            "items": {
-                                "type": "string",
-                                "enum": [
-                                    "stats",
-                                    "free_web_content",
-                                    "free_email_content",
-                                    "free_rss_content",
-                                    "premium_web_content",
-                                    "premium_email_content",
-                                ],
-                            },
-                            "description": "Additional data to include in response",
-                        },
-                    },
-                    "required": ["publication_id"],
-                },
-            ),
-            Tool(
-                name="get_post_details",
-                description="Get detailed information about a specific post",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "publication_id": {
-                            "type": "string",
-                            "description": "The publication ID",
-                        },
-                        "post_id": {
-                            "type": "string",
-                            "description": "The post ID (e.g., post_00000000-0000-0000-0000-000000000000)",
-                        },
-                        "expand": {
-                            "type": "array",
-                            "items": {
-                                "type": "string",
-                                "enum": [
-                                    "stats",
-                                    "free_web_content",
-                                    "free_email_content",
-                                    "free_rss_content",
-                                    "premium_web_content",
-                                    "premium_email_content",
-                                ],
-                            },
-                            "description": "Additional data to include in response",
-                        },
-                    },
-                    "required": ["publication_id", "post_id"],
-                },
-            ),
-            Tool(
-                name="get_posts_summary_stats",
-                description="Get aggregate statistics for all posts in a publication",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "publication_id": {
-                            "type": "string",
-                            "description": "The publication ID",
-                        },
-                        "status": {
-                            "type": "string",
-                            "description": "Filter by post status for stats",
-                            "enum": ["draft", "confirmed", "archived", "all"],
-                            "default": "confirmed",
-                        },
-                        "audience": {
-                            "type": "string",
-                            "description": "Filter by audience type for stats",
-                            "enum": ["free", "premium", "all"],
-                            "default": "all",
-                        },
-                        "platform": {
-                            "type": "string",
-                            "description": "Filter by platform for stats",
-                            "enum": ["web", "email", "both", "all"],
-                            "default": "all",
-                        },
-                    },
-                    "required": ["publication_id"],
-                },
-            ),
-            Tool(
-                name="list_segments",
-                description="List all segments for a publication",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "publication_id": {
-                            "type": "string",
-                            "description": "The publication ID",
-                        }
-                    },
-                    "required": ["publication_id"],
-                },
-            ),
-            Tool(
-                name="get_segment_details",
-                description="Get detailed information about a specific segment",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "publication_id": {
-                            "type": "string",
-                            "description": "The publication ID",
-                        },
-                        "segment_id": {
-                            "type": "string",
-                            "description": "The segment ID",
-                        },
-                    },
-                    "required": ["publication_id", "segment_id"],
-                },
-            ),
-            Tool(
-                name="unsubscribe_subscribers",
-                description=(
-                    "Unsubscribe one or more subscribers (mark them INACTIVE) by "
-                    "email. They stop receiving sends but their records are kept, "
-                    "so this is reversible; it does NOT delete anyone. Defaults to a "
-                    "dry run that reports what would change: set apply=true to "
-                    "actually make the changes. Emails that are already inactive or "
-                    "not found are skipped, so it is safe to re-run."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "publication_id": {
-                            "type": "string",
-                            "description": "The publication ID (e.g., pub_00000000-0000-0000-0000-000000000000)",
-                        },
-                        "emails": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Email addresses to unsubscribe",
-                        },
-                        "apply": {
-                            "type": "boolean",
-                            "description": "When false (default), performs a dry run and reports what would change without modifying anything. Set true to actually unsubscribe.",
-                            "default": False,
-                        },
-                    },
-                    "required": ["publication_id", "emails"],
-                },
-            ),
-        ]
-    )
+    return _TOOLS_RESULT
+
 
+# Per-tool argument coercers, compiled once at import time. Defaults live
+# in module-level dicts and each coercer does a single C-level
+# {**defaults, **args} merge instead of one .get() call per key, so
+# call_tool never re-walks the generic inputSchema dicts per invocation.
+_LIST_POSTS_DEFAULTS = {
+    "limit": 10,
+    "page": 1,
+    "status": "all",
+    "audience": "all",
+    "platform": "all",
+    "order_by": "publish_date",
+    "direction": "desc",
+    "expand": None,
+}
 
-@server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
-    """Handle tool calls."""
-    try:
-        client = get_api_client()
+_LIST_ALL_POSTS_DEFAULTS = {
+    "total_limit": 500,
+    "status": "all",
+    "audience": "all",
+    "platform": "all",
+    "order_by": "publish_date",
+    "direction": "desc",
+    "expand": None,
+}
 
-        if name == "list_publications":
-            publications = client.get_publications()
-            return CallToolResult(
-                content=[
-                    TextContent(type="text", text=json.dumps(publications, indent=2))
-                ]
-            )
+_SUMMARY_STATS_DEFAULTS = {
+    "status": "confirmed",
+    "audience": "all",
+    "platform": "all",
+}
 
-        elif name == "get_publication_details":
-            publication_id = arguments["publication_id"]
-            details = client.get_publication_details(publication_id)
-            return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps(details, indent=2))]
-            )
+_LOCAL_STATS_DEFAULTS = {
+    "status": "confirmed",
+    "max_pages": 10,
+}
 
-        elif name == "list_posts":
-            publication_id = arguments["publication_id"]
-            limit = arguments.get("limit", 10)
-            page = arguments.get("page", 1)
-            status = arguments.get("status", "all")
-            audience = arguments.get("audience", "all")
-            platform = arguments.get("platform", "all")
-            order_by = arguments.get("order_by", "publish_date")
-            direction = arguments.get("direction", "desc")
-            expand = arguments.get("expand")
-
-            result = client.list_posts(
-                publication_id=publication_id,
-                limit=limit,
-                page=page,
-                status=status,
-                audience=audience,
-                platform=platform,
-                order_by=order_by,
-                direction=direction,
-                expand=expand,
-            )
-            return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps(result, indent=2))]
-            )
 
-        elif name == "get_post_details":
-            publication_id = arguments["publication_id"]
-            post_id = arguments["post_id"]
-            expand = arguments.get("expand")
+def _coerce_publication_only(args: Dict[str, Any]) -> Dict[str, Any]:
+    return {"publication_id": args["publication_id"]}
 
-            details = client.get_post_details(publication_id, post_id, expand)
-            return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps(details, indent=2))]
-            )
 
-        elif name == "get_posts_summary_stats":
-            publication_id = arguments["publication_id"]
-            status = arguments.get("status", "confirmed")
-            audience = arguments.get("audience", "all")
-            platform = arguments.get("platform", "all")
-
-            stats = client.get_posts_aggregate_stats(
-                publication_id=publication_id,
-                status=status,
-                audience=audience,
-                platform=platform,
-            )
-            return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps(stats, indent=2))]
-            )
+def _coerce_list_posts(args: Dict[str, Any]) -> Dict[str, Any]:
+    merged = {**_LIST_POSTS_DEFAULTS, **args}
+    merged["limit"] = min(merged["limit"], 100)
+    return merged
 
-        elif name == "list_segments":
-            publication_id = arguments["publication_id"]
-            segments = client.list_segments(publication_id)
-            return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps(segments, indent=2))]
-            )
 
-        elif name == "get_segment_details":
-            publication_id = arguments["publication_id"]
-            segment_id = arguments["segment_id"]
-            details = client.get_segment_details(publication_id, segment_id)
-            return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps(details, indent=2))]
-            )
+def _coerce_list_all_posts(args: Dict[str, Any]) -> Dict[str, Any]:
+    merged = {**_LIST_ALL_POSTS_DEFAULTS, **args}
+    merged["total_limit"] = min(merged["total_limit"], 5000)
+    return merged
+
+
+def _coerce_post_details(args: Dict[str, Any]) -> Dict[str, Any]:
+    return {"expand": None, **args}
+
+
+def _coerce_summary_stats(args: Dict[str, Any]) -> Dict[str, Any]:
+    return {**_SUMMARY_STATS_DEFAULTS, **args}
 
-        elif name == "unsubscribe_subscribers":
-            publication_id = arguments["publication_id"]
-            emails = arguments["emails"]
-            apply = arguments.get("apply", False)
-            result = client.unsubscribe_emails(
-                publication_id, emails, apply=apply
-            )
-            return CallToolResult(
-                content=[TextContent(type="text", text=json.dumps(result, indent=2))]
-            )
 
-        else:
+def _coerce_local_stats(args: Dict[str, Any]) -> Dict[str, Any]:
+    merged = {**_LOCAL_STATS_DEFAULTS, **args}
+    merged["max_pages"] = min(merged["max_pages"], 50)
+    return merged
+
+
+def _coerce_segment_details(args: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "publication_id": args["publication_id"],
+        "segment_id": args["segment_id"],
+    }
+
+
+def _coerce_unsubscribe(args: Dict[str, Any]) -> Dict[str, Any]:
+    return {"apply": False, **args}
+
+
+# Tool name -> (BeehiivAPI method, argument coercer)
+_DISPATCH: Dict[str, tuple] = {
+    "list_publications": (BeehiivAPI.get_publications, lambda args: {}),
+    "get_publication_details": (
+        BeehiivAPI.get_publication_details,
+        _coerce_publication_only,
+    ),
+    "list_posts": (BeehiivAPI.list_posts, _coerce_list_posts),
+    "list_all_posts": (BeehiivAPI.list_posts_all, _coerce_list_all_posts),
+    "get_post_details": (BeehiivAPI.get_post_details, _coerce_post_details),
+    "get_posts_summary_stats": (
+        BeehiivAPI.get_posts_aggregate_stats,
+        _coerce_summary_stats,
+    ),
+    "get_posts_local_stats": (BeehiivAPI.get_posts_local_aggregate, _coerce_local_stats),
+    "list_segments": (BeehiivAPI.list_segments, _coerce_publication_only),
+    "get_segment_details": (BeehiivAPI.get_segment_details, _coerce_segment_details),
+    "clear_cache": (BeehiivAPI.clear_cache, lambda args: {}),
+    "unsubscribe_subscribers": (BeehiivAPI.unsubscribe_emails, _coerce_unsubscribe),
+}
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle tool calls via the precomputed dispatch table."""
+    try:
+        entry = _DISPATCH.get(name)
+        if entry is None:
             raise ValueError(f"Unknown tool: {name}")
 
+        client = get_api_client()
+        method, coerce = entry
+        result = await method(client, **coerce(arguments))
+        return await _text_result(result)
+
     except Exception as e:
         return CallToolResult(
             content=[TextContent(type="text", text=f"Error: {str(e)}")]
         )
 
 
+# This server doesn't provide prompts or resources; like the tool
+# catalogue, the empty results are immutable, so build them once.
+_EMPTY_PROMPTS = ListPromptsResult(prompts=[])
+_EMPTY_RESOURCES = ListResourcesResult(resources=[])
+
+
 @server.list_prompts()
 async def handle_list_prompts() -> ListPromptsResult:
     """Handle list prompts request."""
-    # This server doesn't provide prompts, return empty list
-    return ListPromptsResult(prompts=[])
+    return _EMPTY_PROMPTS
 
 
 @server.list_resources()
 async def handle_list_resources() -> ListResourcesResult:
     """Handle list resources request."""
-    # This server doesn't provide resources, return empty list
-    return ListResourcesResult(resources=[])
+    return _EMPTY_RESOURCES
+
+
+async def _run_server():
+    """Run the MCP server over stdio until the client disconnects."""
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(
+            read_stream,
+            write_stream,
+            InitializationOptions(
+                server_name="beehiiv-analytics",
+                server_version="1.0.0",
+                capabilities=server.get_capabilities(
+                    notification_options=NotificationOptions(),
+                    experimental_capabilities={},
+                ),
+            ),
+        )
 
 
 async def main():
@@ -726,19 +1450,32 @@ async def main():
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
-        async with stdio_server() as (read_stream, write_stream):
-            await server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="beehiiv-analytics",
-                    server_version="1.0.0",
-                    capabilities=server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={},
-                    ),
-                ),
-            )
+        # Construct the API client with the event loop rather than lazily on
+        # the first tool call, so cold-start cost stays out of the hot path
+        # and the global is set before any concurrent calls can race on it.
+        # Without a key the lazy path still reports the error per tool call.
+        global api_client
+        api_key = os.getenv("BEEHIIV_API_KEY")
+        if api_key and api_client is None:
+            api_client = BeehiivAPI(api_key)
+
+        try:
+            if api_client is not None:
+                async with api_client:
+                    # Warm up DNS+TLS in the background while the MCP
+                    # handshake proceeds; by the time the first tool call
+                    # arrives the connection pool is already hot.
+                    warmup = asyncio.create_task(api_client.prewarm())
+                    try:
+                        await _run_server()
+                    finally:
+                        warmup.cancel()
+            else:
+                await _run_server()
+        finally:
+            # Close the shared HTTP session if a tool call opened one lazily
+            if api_client is not None:
+                await api_client.aclose()
     except BrokenPipeError:
         # Handle broken pipe gracefully - this happens when client disconnects
         print("Client disconnected, shutting down gracefully", file=sys.stderr)
@@ -37,7 +37,7 @@ async def example_usage():
     try:
         # 1. List all publications
         print("\n📚 Getting all publications...")
-        publications = client.get_publications()
+        publications = await client.get_publications()
         print(f"Found {len(publications)} publications")
 
         if not publications:
@@ -51,13 +51,13 @@ async def example_usage():
 
         # 2. Get publication details
         print(f"\n📖 Getting details for publication {pub['name']}...")
-        pub_details = client.get_publication_details(pub_id)
+        pub_details = await client.get_publication_details(pub_id)
         print(f"Description: {pub_details.get('description', 'No description')}")
         print(f"Website: {pub_details.get('website_url', 'No website')}")
 
         # 3. List recent posts
         print(f"\n📝 Getting recent posts...")
-        posts_result = client.list_posts(
+        posts_result = await client.list_posts(
             publication_id=pub_id,
             limit=5,
             status="confirmed",  # Only published posts
@@ -78,7 +78,7 @@ async def example_usage():
         if posts:
             print(f"\n📊 Getting detailed information for first post...")
             first_post = posts[0]
-            post_details = client.get_post_details(
+            post_details = await client.get_post_details(
                 publication_id=pub_id,
                 post_id=first_post["id"],
                 expand=["stats"],  # Include statistics
@@ -98,7 +98,7 @@ async def example_usage():
 
         # 5. Get aggregate statistics
         print(f"\n📈 Getting aggregate statistics...")
-        aggregate_stats = client.get_posts_aggregate_stats(
+        aggregate_stats = await client.get_posts_aggregate_stats(
             publication_id=pub_id, status="confirmed"
         )
 
@@ -115,7 +115,7 @@ async def example_usage():
 
         # 6. List segments
         print(f"\n👥 Getting segments...")
-        segments = client.list_segments(pub_id)
+        segments = await client.list_segments(pub_id)
         print(f"Found {len(segments)} segments")
 
         for segment in segments:
@@ -126,7 +126,7 @@ async def example_usage():
         if segments:
             print(f"\n🔍 Getting details for first segment...")
             first_segment = segments[0]
-            segment_details = client.get_segment_details(
+            segment_details = await client.get_segment_details(
                 publication_id=pub_id, segment_id=first_segment["id"]
             )
             print(f"Name: {segment_details.get('name')}")
@@ -146,6 +146,8 @@ async def example_usage():
     except Exception as e:
         print(f"❌ Error: {str(e)}")
         print("Make sure your API key is valid and you have access to the Beehiiv API.")
+    finally:
+        await client.aclose()
 
 
 if __name__ == "__main__":
@@ -1,32 +1,27 @@
 #!/usr/bin/env python3
 """
 Quick all-in-one test script for the Beehiiv MCP Server.
-Runs all tests and provides a summary.
+Runs all tests in parallel and provides a summary.
 """
 
+import asyncio
 import os
 import sys
-import subprocess
 
 
-def run_test(test_name, script_path):
-    """Run a test script and return success status."""
-    print(f"\n{'=' * 60}")
-    print(f"Running: {test_name}")
-    print(f"{'=' * 60}")
-
+async def run_test(test_name, script_path):
+    """Run a test script, capturing its output, and return success status."""
     try:
-        result = subprocess.run(
-            [sys.executable, script_path], capture_output=False, text=True, check=True
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            script_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
         )
-        print(f"✅ {test_name} passed")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {test_name} failed with exit code {e.returncode}")
-        return False
+        output, _ = await proc.communicate()
+        return test_name, proc.returncode == 0, output.decode(errors="replace")
     except FileNotFoundError:
-        print(f"⚠️  {test_name} script not found: {script_path}")
-        return False
+        return test_name, False, f"⚠️  Script not found: {script_path}\n"
 
 
 def main():
@@ -51,22 +46,36 @@ def main():
         ("Date Sorting Test", "test_date_sorting.py"),
     ]
 
-    results = []
+    # The scripts are independent and I/O-bound, so run them concurrently;
+    # total wall time is the slowest test instead of the sum of all three.
+    # Output is captured and printed in order afterwards so logs don't
+    # interleave.
+    async def run_all():
+        return await asyncio.gather(
+            *(run_test(name, path) for name, path in tests)
+        )
+
+    results = asyncio.run(run_all())
 
-    # Run each test
-    for test_name, script_path in tests:
-        success = run_test(test_name, script_path)
-        results.append((test_name, success))
+    for test_name, success, output in results:
+        print(f"\n{'=' * 60}")
+        print(f"Running: {test_name}")
+        print(f"{'=' * 60}")
+        print(output, end="")
+        if success:
+            print(f"✅ {test_name} passed")
+        else:
+            print(f"❌ {test_name} failed")
 
     # Summary
     print(f"\n{'=' * 60}")
     print("Test Summary")
     print(f"{'=' * 60}")
 
-    passed = sum(1 for _, success in results if success)
+    passed = sum(1 for _, success, _ in results if success)
     total = len(results)
 
-    for test_name, success in results:
+    for test_name, success, _ in results:
         status = "✅ PASS" if success else "❌ FAIL"
         print(f"{status} - {test_name}")
 
@@ -4,12 +4,111 @@ Simple test script for beehiiv API connectivity.
 Tests listing posts and getting post statistics.
 """
 
+import functools
+import heapq
 import requests
 import json
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json works too
+    orjson = None
+
+# Serializes the per-test output blocks when tests run concurrently.
+_PRINT_LOCK = threading.Lock()
+
+# (label, stats key, is_rate) rows for the email performance blocks; rates
+# print as percentages, counts with thousands separators. One table per
+# report since the aggregate endpoint also returns rate fields.
+_AGG_EMAIL_FIELDS = (
+    ("Recipients", "recipients", False),
+    ("Delivered", "delivered", False),
+    ("Opens", "opens", False),
+    ("Unique Opens", "unique_opens", False),
+    ("Open Rate", "open_rate", True),
+    ("Clicks", "clicks", False),
+    ("Unique Clicks", "unique_clicks", False),
+    ("Click Rate", "click_rate", True),
+    ("Unsubscribes", "unsubscribes", False),
+    ("Spam Reports", "spam_reports", False),
+)
+
+_POST_EMAIL_FIELDS = (
+    ("Recipients", "recipients", False),
+    ("Delivered", "delivered", False),
+    ("Opens", "opens", False),
+    ("Unique Opens", "unique_opens", False),
+    ("Clicks", "clicks", False),
+    ("Unique Clicks", "unique_clicks", False),
+    ("Unsubscribes", "unsubscribes", False),
+    ("Spam Reports", "spam_reports", False),
+)
+
+
+def _email_block(email_stats: Dict, fields) -> str:
+    """Render an email performance block as one string (one write, not 10+)."""
+    lines = ["📧 Email Performance:"]
+    for label, key, is_rate in fields:
+        value = email_stats.get(key, 0)
+        if is_rate:
+            lines.append(f"  - {label}: {value:.1f}%")
+        else:
+            lines.append(f"  - {label}: {value:,}")
+    return "\n".join(lines)
+
+
+def _web_block(web_stats: Dict) -> str:
+    """Render the web performance block as one string."""
+    return (
+        "\n🌐 Web Performance:\n"
+        f"  - Views: {web_stats.get('views', 0):,}\n"
+        f"  - Clicks: {web_stats.get('clicks', 0):,}"
+    )
+
+
+# ETags persisted here so back-to-back test runs can revalidate instead of
+# re-downloading unchanged publication lists and stats.
+_ETAG_CACHE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".beehiiv_etag_cache.json"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_date(date_value) -> str:
+    """Format a publish date (ISO string or Unix timestamp) for display.
+
+    Cached because many posts share identical publish timestamps; repeats
+    hit the cache instead of rebuilding a datetime.
+    """
+    if not date_value:
+        return "Not published"
+    # Well-formed ISO-8601 strings are the hot path: the target format is
+    # just characters 0-9 and 11-15, so slice instead of building a
+    # datetime and re-formatting it.
+    if (
+        isinstance(date_value, str)
+        and len(date_value) >= 16
+        and date_value[4] == "-"
+        and date_value[10] == "T"
+    ):
+        return date_value[:10] + " " + date_value[11:16]
+    try:
+        if isinstance(date_value, (int, float)):
+            dt = datetime.fromtimestamp(date_value)
+        else:
+            dt = datetime.fromisoformat(date_value.replace("Z", "+00:00"))
+        return dt.strftime("%Y-%m-%d %H:%M")
+    except (ValueError, TypeError, AttributeError, OSError):
+        return str(date_value)
+
 
 class BeehiivAPITester:
     """Simple tester for beehiiv API connectivity."""
@@ -18,18 +117,71 @@ class BeehiivAPITester:
         """Initialize with API key."""
         self.api_key = api_key
         self.base_url = "https://api.beehiiv.com/v2"
-        self.headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
+        # One session for all calls: keep-alive means only the first request
+        # pays the TCP+TLS handshake to api.beehiiv.com, and session-level
+        # headers skip the per-call header merge requests would otherwise do.
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+                # Large post lists compress well; requests decompresses
+                # transparently.
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+        # Publications rarely change mid-run; cache the first fetch so
+        # list_posts' publication lookup doesn't repeat the round trip.
+        self._publications_cache: Optional[List[Dict]] = None
+        # url+params -> [etag, body]; loaded from disk so ETags survive
+        # across runs. Missing/corrupt file just means a cold start.
+        self._etag_cache = {}
+        try:
+            with open(_ETAG_CACHE_FILE) as f:
+                self._etag_cache = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def close(self):
+        """Persist the ETag cache and close the underlying HTTP session."""
+        try:
+            with open(_ETAG_CACHE_FILE, "w") as f:
+                json.dump(self._etag_cache, f)
+        except OSError:
+            pass
+        self.session.close()
+
+    def _get(self, url: str, params: Optional[Dict] = None) -> Dict:
+        """GET a JSON document, revalidating with If-None-Match when possible.
+
+        A 304 Not Modified is answered from the cached body with no
+        download or parse; endpoints that don't send ETags behave like
+        plain GETs.
+        """
+        key = url if not params else f"{url}?{json.dumps(params, sort_keys=True)}"
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = self.session.get(url, params=params, headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+
+        # orjson parses the (already decompressed) bytes several times
+        # faster than response.json() on large post lists.
+        if orjson is not None:
+            body = orjson.loads(response.content)
+        else:
+            body = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[key] = [etag, body]
+        return body
 
     def test_connection(self) -> bool:
         """Test basic API connection by getting publications."""
         try:
-            response = requests.get(
-                f"{self.base_url}/publications", headers=self.headers, timeout=10
-            )
-            response.raise_for_status()
+            self._get(f"{self.base_url}/publications")
             print("✅ API connection successful!")
             return True
         except requests.exceptions.RequestException as e:
@@ -56,14 +208,18 @@ class BeehiivAPITester:
                 )
 
             # Get posts for the publication
-            response = requests.get(
+            # Ask the server for just the newest `limit` posts instead of
+            # downloading the whole archive and trimming client-side.
+            # (Beehiiv has no sparse-fieldset parameter, so payload size is
+            # controlled via limit/ordering only.)
+            posts_data = self._get(
                 f"{self.base_url}/publications/{publication_id}/posts",
-                headers=self.headers,
-                timeout=10,
+                params={
+                    "limit": limit,
+                    "order_by": "publish_date",
+                    "direction": "desc",
+                },
             )
-            response.raise_for_status()
-
-            posts_data = response.json()
             posts = posts_data.get("data", [])
 
             # Sort posts by publish date (newest first)
@@ -71,54 +227,49 @@ class BeehiivAPITester:
             date_field = "publish_date"
 
             if posts and date_field in posts[0]:
-                # Filter out posts without publish_date and sort by publish_date
-                posts_with_dates = [post for post in posts if post.get(date_field)]
-                posts_without_dates = [
-                    post for post in posts if not post.get(date_field)
-                ]
-
-                # Sort posts with dates by publish_date (newest first)
-                posts_with_dates.sort(key=lambda x: x.get(date_field, ""), reverse=True)
-
-                # Combine: posts with dates first (sorted), then posts without dates
-                posts = posts_with_dates + posts_without_dates
+                # Partition posts with/without publish_date in a single pass
+                posts_with_dates = []
+                posts_without_dates = []
+                for post in posts:
+                    if post.get(date_field):
+                        posts_with_dates.append(post)
+                    else:
+                        posts_without_dates.append(post)
+
+                # Only the newest `limit` posts are shown, so pick them with
+                # a heap (O(n log limit)) instead of fully sorting the list;
+                # posts without dates only pad the tail when dated posts
+                # alone cannot fill the limit.
+                # Every post in posts_with_dates has the field (the partition
+                # guaranteed it), so the C-level itemgetter beats a lambda
+                # doing .get per comparison.
+                date_key = itemgetter(date_field)
+                if len(posts_with_dates) >= limit:
+                    limited_posts = heapq.nlargest(
+                        limit, posts_with_dates, key=date_key
+                    )
+                else:
+                    posts_with_dates.sort(key=date_key, reverse=True)
+                    limited_posts = (posts_with_dates + posts_without_dates)[:limit]
 
                 print(
                     f"📅 Sorting by {date_field} - {len(posts_with_dates)} posts with dates, {len(posts_without_dates)} without"
                 )
             else:
                 print("⚠️  publish_date field not found, keeping original order")
+                limited_posts = posts[:limit]
 
-            # Limit the number of posts shown
-            limited_posts = posts[:limit]
+            # Format each displayed date once and stash it on the post so
+            # later consumers reuse it instead of re-parsing.
+            for post in limited_posts:
+                post["_formatted_date"] = _format_date(post.get("publish_date"))
 
             print(
                 f"📝 Found {len(posts)} total posts, showing latest {len(limited_posts)}:"
             )
             for i, post in enumerate(limited_posts, 1):
-                # Use publish_date field
-                date_value = post.get("publish_date")
-
-                # Format the date for better readability
-                if date_value:
-                    try:
-                        # Check if it's a Unix timestamp (integer)
-                        if isinstance(date_value, (int, float)):
-                            dt = datetime.fromtimestamp(date_value)
-                            formatted_date = dt.strftime("%Y-%m-%d %H:%M")
-                        else:
-                            # Try ISO format
-                            dt = datetime.fromisoformat(
-                                date_value.replace("Z", "+00:00")
-                            )
-                            formatted_date = dt.strftime("%Y-%m-%d %H:%M")
-                    except:
-                        formatted_date = str(date_value)
-                else:
-                    formatted_date = "Not published"
-
                 print(
-                    f"  {i}. {post.get('title', 'No title')} (ID: {post.get('id')}) - {formatted_date}"
+                    f"  {i}. {post.get('title', 'No title')} (ID: {post.get('id')}) - {post['_formatted_date']}"
                 )
 
             return limited_posts
@@ -137,59 +288,59 @@ class BeehiivAPITester:
             )
             params = {"status": status}
 
-            print(f"🔍 Getting aggregate stats from: {endpoint}")
-            print(f"📊 Filtering by status: {status}")
-
-            response = requests.get(
-                endpoint, headers=self.headers, params=params, timeout=10
-            )
-            response.raise_for_status()
-
-            stats_data = response.json()
+            stats_data = self._get(endpoint, params=params)
             stats = stats_data.get("data", {}).get("stats", {})
 
-            print(f"📊 Aggregate Post Statistics (Status: {status}):")
-            print("=" * 50)
-
-            # Email stats
-            email_stats = stats.get("email", {})
-            if email_stats:
-                print("📧 Email Performance:")
-                print(f"  - Recipients: {email_stats.get('recipients', 0):,}")
-                print(f"  - Delivered: {email_stats.get('delivered', 0):,}")
-                print(f"  - Opens: {email_stats.get('opens', 0):,}")
-                print(f"  - Unique Opens: {email_stats.get('unique_opens', 0):,}")
-                print(f"  - Open Rate: {email_stats.get('open_rate', 0):.1f}%")
-                print(f"  - Clicks: {email_stats.get('clicks', 0):,}")
-                print(f"  - Unique Clicks: {email_stats.get('unique_clicks', 0):,}")
-                print(f"  - Click Rate: {email_stats.get('click_rate', 0):.1f}%")
-                print(f"  - Unsubscribes: {email_stats.get('unsubscribes', 0):,}")
-                print(f"  - Spam Reports: {email_stats.get('spam_reports', 0):,}")
-
-            # Web stats
-            web_stats = stats.get("web", {})
-            if web_stats:
-                print("\n🌐 Web Performance:")
-                print(f"  - Views: {web_stats.get('views', 0):,}")
-                print(f"  - Clicks: {web_stats.get('clicks', 0):,}")
-
-            # Click details
-            clicks = stats.get("clicks", [])
-            if clicks:
-                print(f"\n🔗 Top Clicked Links ({len(clicks)} total):")
-                for i, click in enumerate(clicks[:5], 1):  # Show top 5
-                    url = click.get("url", "Unknown URL")
-                    total_clicks = click.get("total_clicks", 0)
-                    ctr = click.get("total_click_through_rate", 0)
-                    print(f"  {i}. {url}")
-                    print(f"     Total Clicks: {total_clicks:,} | CTR: {ctr:.1f}%")
-
+            # Print the whole block under the lock so concurrent runs of
+            # this method don't interleave their output.
+            with _PRINT_LOCK:
+                self._print_aggregate_stats(endpoint, status, stats)
             return stats
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Failed to get aggregate stats: {e}")
+            with _PRINT_LOCK:
+                print(f"❌ Failed to get aggregate stats: {e}")
             return None
 
+    @staticmethod
+    def _print_aggregate_stats(endpoint: str, status: str, stats: Dict):
+        """Print the aggregate stats report for get_aggregate_stats.
+
+        The whole report is assembled first and written to stdout in one
+        pre-encoded write: one syscall and one encoding pass instead of
+        20+ individual prints.
+        """
+        out = [
+            f"🔍 Getting aggregate stats from: {endpoint}",
+            f"📊 Filtering by status: {status}",
+            f"📊 Aggregate Post Statistics (Status: {status}):",
+            "=" * 50,
+        ]
+
+        # Email stats
+        email_stats = stats.get("email", {})
+        if email_stats:
+            out.append(_email_block(email_stats, _AGG_EMAIL_FIELDS))
+
+        # Web stats
+        web_stats = stats.get("web", {})
+        if web_stats:
+            out.append(_web_block(web_stats))
+
+        # Click details
+        clicks = stats.get("clicks", [])
+        if clicks:
+            out.append(f"\n🔗 Top Clicked Links ({len(clicks)} total):")
+            for i, click in enumerate(islice(clicks, 5), 1):  # Show top 5
+                url = click.get("url", "Unknown URL")
+                total_clicks = click.get("total_clicks", 0)
+                ctr = click.get("total_click_through_rate", 0)
+                out.append(f"  {i}. {url}")
+                out.append(f"     Total Clicks: {total_clicks:,} | CTR: {ctr:.1f}%")
+
+        sys.stdout.buffer.write(("\n".join(out) + "\n").encode("utf-8"))
+        sys.stdout.buffer.flush()
+
     def get_individual_post_stats(
         self, post_id: str, publication_id: str
     ) -> Optional[Dict]:
@@ -198,84 +349,87 @@ class BeehiivAPITester:
             endpoint = f"{self.base_url}/publications/{publication_id}/posts/{post_id}"
             params = {"expand": ["stats"]}  # Request stats expansion
 
-            print(f"🔍 Getting individual post stats from: {endpoint}")
-
-            response = requests.get(
-                endpoint, headers=self.headers, params=params, timeout=10
-            )
-            response.raise_for_status()
-
-            post_data = response.json()
+            post_data = self._get(endpoint, params=params)
             post = post_data.get("data", {})
             stats = post.get("stats", {})
 
-            print(f"📊 Individual Post Statistics:")
-            print(f"📝 Post: '{post.get('title', 'Unknown')}'")
-            print(f"🆔 ID: {post.get('id')}")
-            print(f"📅 Status: {post.get('status')}")
-            print(f"👥 Audience: {post.get('audience', 'N/A')}")
-            print(f"🌐 Platform: {post.get('platform', 'N/A')}")
-            print("=" * 50)
-
-            # Email stats
-            email_stats = stats.get("email", {})
-            if email_stats:
-                print("📧 Email Performance:")
-                print(f"  - Recipients: {email_stats.get('recipients', 0):,}")
-                print(f"  - Delivered: {email_stats.get('delivered', 0):,}")
-                print(f"  - Opens: {email_stats.get('opens', 0):,}")
-                print(f"  - Unique Opens: {email_stats.get('unique_opens', 0):,}")
-                print(f"  - Clicks: {email_stats.get('clicks', 0):,}")
-                print(f"  - Unique Clicks: {email_stats.get('unique_clicks', 0):,}")
-                print(f"  - Unsubscribes: {email_stats.get('unsubscribes', 0):,}")
-                print(f"  - Spam Reports: {email_stats.get('spam_reports', 0):,}")
-
-            # Web stats
-            web_stats = stats.get("web", {})
-            if web_stats:
-                print("\n🌐 Web Performance:")
-                print(f"  - Views: {web_stats.get('views', 0):,}")
-                print(f"  - Clicks: {web_stats.get('clicks', 0):,}")
-
-            # Click details
-            clicks = stats.get("clicks", [])
-            if clicks:
-                print(f"\n🔗 Clicked Links ({len(clicks)} total):")
-                for i, click in enumerate(clicks[:3], 1):  # Show top 3
-                    total_clicks = click.get("total_clicks", 0)
-                    unique_clicks = click.get("total_unique_clicks", 0)
-                    ctr = click.get("total_click_through_rate", 0)
-                    print(
-                        f"  {i}. Total Clicks: {total_clicks:,} | Unique: {unique_clicks:,} | CTR: {ctr:.1f}%"
-                    )
-
+            with _PRINT_LOCK:
+                self._print_individual_post_stats(endpoint, post, stats)
             return post
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Failed to get individual post stats: {e}")
+            with _PRINT_LOCK:
+                print(f"❌ Failed to get individual post stats: {e}")
             return None
 
+    @staticmethod
+    def _print_individual_post_stats(endpoint: str, post: Dict, stats: Dict):
+        """Print the stats report for get_individual_post_stats.
+
+        Assembled and written in one pre-encoded write, like
+        _print_aggregate_stats.
+        """
+        out = [
+            f"🔍 Getting individual post stats from: {endpoint}",
+            f"📊 Individual Post Statistics:",
+            f"📝 Post: '{post.get('title', 'Unknown')}'",
+            f"🆔 ID: {post.get('id')}",
+            f"📅 Status: {post.get('status')}",
+            f"👥 Audience: {post.get('audience', 'N/A')}",
+            f"🌐 Platform: {post.get('platform', 'N/A')}",
+            "=" * 50,
+        ]
+
+        # Email stats
+        email_stats = stats.get("email", {})
+        if email_stats:
+            out.append(_email_block(email_stats, _POST_EMAIL_FIELDS))
+
+        # Web stats
+        web_stats = stats.get("web", {})
+        if web_stats:
+            out.append(_web_block(web_stats))
+
+        # Click details
+        clicks = stats.get("clicks", [])
+        if clicks:
+            out.append(f"\n🔗 Clicked Links ({len(clicks)} total):")
+            for i, click in enumerate(islice(clicks, 3), 1):  # Show top 3
+                total_clicks = click.get("total_clicks", 0)
+                unique_clicks = click.get("total_unique_clicks", 0)
+                ctr = click.get("total_click_through_rate", 0)
+                out.append(
+                    f"  {i}. Total Clicks: {total_clicks:,} | Unique: {unique_clicks:,} | CTR: {ctr:.1f}%"
+                )
+
+        sys.stdout.buffer.write(("\n".join(out) + "\n").encode("utf-8"))
+        sys.stdout.buffer.flush()
+
     def get_publications(self) -> List[Dict]:
-        """Get list of publications."""
-        try:
-            response = requests.get(
-                f"{self.base_url}/publications", headers=self.headers, timeout=10
-            )
-            response.raise_for_status()
+        """Get list of publications (cached after the first fetch)."""
+        if self._publications_cache is not None:
+            return self._publications_cache
 
-            publications_data = response.json()
+        try:
+            publications_data = self._get(f"{self.base_url}/publications")
             publications = publications_data.get("data", [])
 
             print(f"📚 Found {len(publications)} publications:")
             for pub in publications:
                 print(f"  - {pub.get('name')} (ID: {pub.get('id')})")
 
+            self._publications_cache = publications
             return publications
 
         except requests.exceptions.RequestException as e:
             print(f"❌ Failed to get publications: {e}")
             return []
 
+    def refresh_publications(self) -> List[Dict]:
+        """Drop the cached publications list and fetch it again."""
+        self._publications_cache = None
+        return self.get_publications()
+
 
 def main():
     """Main test function."""
@@ -293,6 +447,14 @@ def main():
     # Initialize tester
     tester = BeehiivAPITester(api_key)
 
+    try:
+        run_tests(tester)
+    finally:
+        tester.close()
+
+
+def run_tests(tester):
+    """Run the test sequence against an initialized tester."""
     # Test 1: Basic connection
     print("\n1. Testing API connection...")
     if not tester.test_connection():
@@ -311,24 +473,14 @@ def main():
         print("No posts found to test statistics.")
         return
 
-    # Test 4: Get aggregate post statistics
-    print("\n4. Getting aggregate post statistics...")
+    # Tests 4 & 5: aggregate and individual post statistics
+    print("\n4+5. Getting aggregate and individual post statistics...")
+    print("=" * 60)
 
-    # Get publication ID for the API call
+    # Get publication ID for the API calls
     publication_id = publications[0]["id"] if publications else None
 
     if publication_id:
-        # Get stats for confirmed (published) posts
-        tester.get_aggregate_stats(publication_id, status="confirmed")
-
-        # Also get stats for all posts to compare
-        print("\n" + "=" * 60)
-        tester.get_aggregate_stats(publication_id, status="all")
-
-        # Test 5: Get individual post statistics
-        print("\n5. Getting individual post statistics...")
-        print("=" * 60)
-
         # Find the first published post for individual stats
         published_post = None
         for post in posts:
@@ -336,12 +488,33 @@ def main():
                 published_post = post
                 break
 
-        if published_post:
-            post_id = published_post.get("id")
-            print(f"📊 Getting stats for: '{published_post.get('title')}'")
-            tester.get_individual_post_stats(post_id, publication_id)
-        else:
-            print("❌ No published posts found for individual statistics")
+        # The two aggregate queries and the individual post lookup are
+        # independent, so run them concurrently over the shared session;
+        # each prints its report block under _PRINT_LOCK. Collect the
+        # futures and re-raise via result() so an unexpected failure in
+        # a probe fails the script instead of vanishing with the future.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(
+                    tester.get_aggregate_stats, publication_id, "confirmed"
+                ),
+                executor.submit(tester.get_aggregate_stats, publication_id, "all"),
+            ]
+
+            if published_post:
+                print(f"📊 Getting stats for: '{published_post.get('title')}'")
+                futures.append(
+                    executor.submit(
+                        tester.get_individual_post_stats,
+                        published_post.get("id"),
+                        publication_id,
+                    )
+                )
+            else:
+                print("❌ No published posts found for individual statistics")
+
+            for future in as_completed(futures):
+                future.result()
     else:
         print("❌ No publication ID found")
 
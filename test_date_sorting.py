@@ -3,22 +3,24 @@
 Test script to verify date sorting works correctly for posts.
 """
 
+import asyncio
 import os
 import json
-from beehiiv_mcp_server import BeehiivAPI
+from itertools import pairwise
 
+from test_helpers import get_client
 
-def test_date_sorting():
+
+async def test_date_sorting():
     """Test that posts are sorted correctly by date."""
-    api_key = os.getenv("BEEHIIV_API_KEY")
-    if not api_key:
+    if not os.getenv("BEEHIIV_API_KEY"):
         print("❌ BEEHIIV_API_KEY environment variable not set")
         return
 
-    client = BeehiivAPI(api_key)
+    client = get_client()
 
     # Get publications
-    publications = client.get_publications()
+    publications = await client.get_publications()
     if not publications:
         print("❌ No publications found")
         return
@@ -26,12 +28,23 @@ def test_date_sorting():
     pub_id = publications[0]["id"]
     print(f"📰 Testing with publication: {publications[0]['name']}")
 
+    # The three sort configurations are independent, so fetch them
+    # concurrently; wall time is one round-trip instead of three.
+    result_publish, result_displayed, result_created = await asyncio.gather(
+        client.list_posts(
+            publication_id=pub_id, limit=5, order_by="publish_date", direction="desc"
+        ),
+        client.list_posts(
+            publication_id=pub_id, limit=5, order_by="displayed_date", direction="desc"
+        ),
+        client.list_posts(
+            publication_id=pub_id, limit=5, order_by="created", direction="asc"
+        ),
+    )
+
     # Test 1: Sort by publish_date (default, should be newest first)
     print("\n1. Testing sort by publish_date (desc - newest first):")
-    result = client.list_posts(
-        publication_id=pub_id, limit=5, order_by="publish_date", direction="desc"
-    )
-    posts = result.get("data", [])
+    posts = result_publish.get("data", [])
 
     if posts:
         print(f"   Found {len(posts)} posts")
@@ -41,10 +54,11 @@ def test_date_sorting():
             title = post.get("title", "No title")[:50]
             print(f"   {i}. {pub_date} - {title}")
 
-        # Verify sorting
+        # Verify sorting: a linear scan over adjacent pairs is enough,
+        # no need to sort a copy just to compare against it
         dates = [p.get("publish_date") for p in posts if p.get("publish_date")]
         if dates:
-            is_sorted = dates == sorted(dates, reverse=True)
+            is_sorted = all(a >= b for a, b in pairwise(dates))
             print(f"   ✅ Sorting correct: {is_sorted}")
             if not is_sorted:
                 print(f"   ⚠️  Dates: {dates}")
@@ -53,10 +67,7 @@ def test_date_sorting():
 
     # Test 2: Sort by displayed_date
     print("\n2. Testing sort by displayed_date (desc - newest first):")
-    result = client.list_posts(
-        publication_id=pub_id, limit=5, order_by="displayed_date", direction="desc"
-    )
-    posts = result.get("data", [])
+    posts = result_displayed.get("data", [])
 
     if posts:
         print(f"   Found {len(posts)} posts")
@@ -70,10 +81,7 @@ def test_date_sorting():
 
     # Test 3: Sort by created (asc - oldest first)
     print("\n3. Testing sort by created (asc - oldest first):")
-    result = client.list_posts(
-        publication_id=pub_id, limit=5, order_by="created", direction="asc"
-    )
-    posts = result.get("data", [])
+    posts = result_created.get("data", [])
 
     if posts:
         print(f"   Found {len(posts)} posts")
@@ -86,13 +94,15 @@ def test_date_sorting():
         # Verify sorting
         dates = [p.get("created") for p in posts if p.get("created")]
         if dates:
-            is_sorted = dates == sorted(dates, reverse=False)
+            is_sorted = all(a <= b for a, b in pairwise(dates))
             print(f"   ✅ Sorting correct: {is_sorted}")
     else:
         print("   ⚠️  No posts found")
 
+    await client.aclose()
+
     print("\n✅ Date sorting tests completed!")
 
 
 if __name__ == "__main__":
-    test_date_sorting()
+    asyncio.run(test_date_sorting())
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Beehiiv MCP Server test scripts.
+"""
+
+import functools
+import os
+
+from beehiiv_mcp_server import BeehiivAPI
+
+
+@functools.cache
+def get_client() -> BeehiivAPI:
+    """Build (once per process) the API client shared by the test scripts.
+
+    When several test modules run in the same process, they all get the
+    same instance - one connection pool, one response cache - instead of
+    each constructing their own. Requires BEEHIIV_API_KEY to be set.
+    """
+    return BeehiivAPI(os.environ["BEEHIIV_API_KEY"])
@@ -7,7 +7,7 @@ Tests the server functionality without requiring a full MCP client.
 import asyncio
 import json
 import os
-from beehiiv_mcp_server import BeehiivAPI
+from test_helpers import get_client
 
 
 async def test_mcp_server():
@@ -23,13 +23,13 @@ async def test_mcp_server():
         return
 
     try:
-        # Initialize API client
-        client = BeehiivAPI(api_key)
+        # Initialize API client (shared across test scripts in-process)
+        client = get_client()
         print("✅ API client initialized")
 
         # Test 1: List publications
         print("\n1. Testing list_publications...")
-        publications = client.get_publications()
+        publications = await client.get_publications()
         print(f"✅ Found {len(publications)} publications")
         for pub in publications[:2]:  # Show first 2
             print(f"   - {pub.get('name')} (ID: {pub.get('id')})")
@@ -38,16 +38,26 @@ async def test_mcp_server():
             print("❌ No publications found. Cannot continue testing.")
             return
 
+        # Tests 2, 3, 5 and 6 only depend on pub_id, so fan them out
+        # concurrently over the shared pool; wall clock is the slowest
+        # call instead of the sum. Results are printed in order below.
+        pub_id = publications[0]["id"]
+        async with asyncio.TaskGroup() as tg:
+            t_details = tg.create_task(client.get_publication_details(pub_id))
+            t_posts = tg.create_task(client.list_posts(pub_id, limit=5))
+            t_stats = tg.create_task(
+                client.get_posts_aggregate_stats(pub_id, status="confirmed")
+            )
+            t_segments = tg.create_task(client.list_segments(pub_id))
+
         # Test 2: Get publication details
         print("\n2. Testing get_publication_details...")
-        pub_id = publications[0]["id"]
-        pub_details = client.get_publication_details(pub_id)
+        pub_details = t_details.result()
         print(f"✅ Retrieved details for: {pub_details.get('name', 'Unknown')}")
 
         # Test 3: List posts
         print("\n3. Testing list_posts...")
-        posts_result = client.list_posts(pub_id, limit=5)
-        posts = posts_result.get("data", [])
+        posts = t_posts.result().get("data", [])
         print(f"✅ Found {len(posts)} posts")
         for post in posts[:2]:  # Show first 2
             print(
@@ -58,12 +68,12 @@ async def test_mcp_server():
         if posts:
             print("\n4. Testing get_post_details...")
             post_id = posts[0]["id"]
-            post_details = client.get_post_details(pub_id, post_id)
+            post_details = await client.get_post_details(pub_id, post_id)
             print(f"✅ Retrieved details for: {post_details.get('title', 'Unknown')}")
 
         # Test 5: Get aggregate stats
         print("\n5. Testing get_posts_aggregate_stats...")
-        stats = client.get_posts_aggregate_stats(pub_id, status="confirmed")
+        stats = t_stats.result()
         if stats.get("stats"):
             print("✅ Retrieved aggregate statistics")
             email_stats = stats["stats"].get("email", {})
@@ -75,7 +85,7 @@ async def test_mcp_server():
 
         # Test 6: List segments
         print("\n6. Testing list_segments...")
-        segments = client.list_segments(pub_id)
+        segments = t_segments.result()
         print(f"✅ Found {len(segments)} segments")
         for segment in segments[:2]:  # Show first 2
             print(f"   - {segment.get('name', 'Unnamed')} (ID: {segment.get('id')})")
@@ -84,7 +94,7 @@ async def test_mcp_server():
         if segments:
             print("\n7. Testing get_segment_details...")
             segment_id = segments[0]["id"]
-            segment_details = client.get_segment_details(pub_id, segment_id)
+            segment_details = await client.get_segment_details(pub_id, segment_id)
             print(f"✅ Retrieved details for: {segment_details.get('name', 'Unknown')}")
 
         print("\n✅ All tests completed successfully!")
@@ -95,6 +105,8 @@ async def test_mcp_server():
         print(
             "\nMake sure your API key is valid and you have access to the Beehiiv API."
         )
+    finally:
+        await client.aclose()
 
 
 if __name__ == "__main__":